@@ -1,12 +1,19 @@
 import datetime
+import hashlib
+import os
 import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Type  # pylint: disable=unused-import
 
 from airflow import DAG
 from airflow.operators import BaseOperator
 
 from dagster import ExecutionTargetHandle, RunConfig, check, seven
 from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.objects import ExecutionStep
+from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.instance import DagsterInstance
+from dagster.seven import lru_cache
 
 from .compile import coalesce_execution_steps
 from .operators.docker_operator import DagsterDockerOperator
@@ -26,6 +33,24 @@ DEFAULT_ARGS = {
 # Airflow DAG names are not allowed to be longer than 250 chars
 AIRFLOW_MAX_DAG_NAME_LEN = 250
 
+# Characters that are not legal in Airflow DAG names
+_AIRFLOW_NAME_RE = re.compile(r'[^\w\-\.]')
+
+# The output of coalesce_execution_steps: solid handles, in order, to their execution steps
+_CoalescedPlan = Dict[str, List[ExecutionStep]]
+
+# The resolved mode, execution plan and coalesced plan for a set of DAG factory inputs
+_PlanCacheEntry = Tuple[str, ExecutionPlan, _CoalescedPlan]
+
+# Airflow re-parses DAG definition files on every scheduler heartbeat, so we cache the compiled
+# execution plans (keyed on the inputs that determine them) and only rebuild the Airflow DAG and
+# task objects on each call.
+_PLAN_CACHE_MAX_SIZE = 32
+_PLAN_CACHE = OrderedDict()  # type: OrderedDict[Tuple[str, str, str, str], _PlanCacheEntry]
+
+# Set DAGSTER_FAST_CHECKS=1 to skip the per-key type checks on already-validated dict params
+_FAST_CHECKS = os.getenv('DAGSTER_FAST_CHECKS') == '1'
+
 
 def _make_dag_description(pipeline_name):
     return '''Editable scaffolding autogenerated by dagster-airflow from pipeline {pipeline_name}
@@ -35,37 +60,164 @@ def _make_dag_description(pipeline_name):
 
 
 def _rename_for_airflow(name):
+    # type: (str) -> str
     '''Modify pipeline name for Airflow to meet constraints on DAG names:
     https://github.com/apache/airflow/blob/1.10.3/airflow/utils/helpers.py#L52-L63
 
     Here, we just substitute underscores for illegal characters to avoid imposing Airflow's
     constraints on our naming schemes.
     '''
-    return re.sub(r'[^\w\-\.]', '_', name)[:AIRFLOW_MAX_DAG_NAME_LEN]
+    return _AIRFLOW_NAME_RE.sub('_', name)[:AIRFLOW_MAX_DAG_NAME_LEN]
+
+
+def _opt_dict_param(obj, param_name):
+    # type: (Optional[Dict[str, Any]], str) -> Dict[str, Any]
+    '''Equivalent to ``check.opt_dict_param(obj, param_name, key_type=str)``.
+
+    If DAGSTER_FAST_CHECKS is set, plain dicts and None are accepted with a single type test.
+    Anything else still goes through the full check, so error messages are unchanged.
+    '''
+    if _FAST_CHECKS:
+        if obj is None:
+            return {}
+        if type(obj) is dict:  # pylint: disable=unidiomatic-typecheck
+            return obj
+    return check.opt_dict_param(obj, param_name, key_type=str)
+
+
+@lru_cache(maxsize=1)
+def _default_instance(dagster_home):  # pylint: disable=unused-argument
+    # type: (Optional[str]) -> DagsterInstance
+    '''The instance to use when none is passed to the DAG factories.
+
+    Resolving the default instance reads instance config from disk, so we do it once per process
+    rather than on every DAG file parse. ``dagster_home`` is the current value of $DAGSTER_HOME,
+    which is passed only so that changing it invalidates the cache.
+    '''
+    # Default to use the (persistent) system temp directory rather than a seven.TemporaryDirectory,
+    # which would not be consistent between Airflow task invocations.
+    return DagsterInstance.get(fallback_storage=seven.get_system_temp_directory())
+
+
+def _plan_cache_key(handle, pipeline_name, environment_dict, mode):
+    # type: (ExecutionTargetHandle, str, Dict[str, Any], Optional[str]) -> Tuple[str, str, str, str]
+    environment_dict_hash = hashlib.sha1(
+        seven.json.dumps(environment_dict, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+    return (
+        seven.json.dumps(handle.to_dict(), sort_keys=True),
+        pipeline_name,
+        mode or '',
+        environment_dict_hash,
+    )
+
+
+def _is_plan_cacheable(handle):
+    # type: (ExecutionTargetHandle) -> bool
+    '''Handles that load from a python file (directly, or via a repository yaml) re-execute that
+    file on every load, so edits to the pipeline are picked up on the next DAG file parse. We must
+    not cache plans for those, since nothing in the cache key would change when the file does.
+    Module handles go through importlib, which already caches the module for the process.
+    '''
+    return not (handle.data.python_file or handle.data.repository_yaml)
+
+
+def _build_coalesced_execution_plan(handle, environment_dict, mode):
+    # type: (ExecutionTargetHandle, Dict[str, Any], Optional[str]) -> _PlanCacheEntry
+    pipeline = handle.build_pipeline_definition()
+
+    if mode is None:
+        mode = pipeline.get_default_mode_name()
+
+    execution_plan = create_execution_plan(
+        pipeline, environment_dict, run_config=RunConfig(mode=mode)
+    )
+
+    return (mode, execution_plan, coalesce_execution_steps(execution_plan))
+
+
+def _get_coalesced_execution_plan(handle, pipeline_name, environment_dict, mode):
+    # type: (ExecutionTargetHandle, str, Dict[str, Any], Optional[str]) -> _PlanCacheEntry
+    '''Build (or fetch from the plan cache) the execution plan for a pipeline, coalesced by solid.
+
+    Returns:
+        Tuple[str, ExecutionPlan, OrderedDict[str, List[ExecutionStep]]]: The resolved mode, the
+        execution plan, and the output of ``coalesce_execution_steps``.
+    '''
+    if not _is_plan_cacheable(handle):
+        return _build_coalesced_execution_plan(handle, environment_dict, mode)
+
+    key = _plan_cache_key(handle, pipeline_name, environment_dict, mode)
+
+    if key in _PLAN_CACHE:
+        # Reinsert to mark this entry as most recently used
+        cached = _PLAN_CACHE.pop(key)
+        _PLAN_CACHE[key] = cached
+        return cached
+
+    _PLAN_CACHE[key] = _build_coalesced_execution_plan(handle, environment_dict, mode)
+    while len(_PLAN_CACHE) > _PLAN_CACHE_MAX_SIZE:
+        _PLAN_CACHE.popitem(last=False)
+
+    return _PLAN_CACHE[key]
+
+
+def _coalesced_dependency_edges(execution_plan, coalesced_plan):
+    # type: (ExecutionPlan, _CoalescedPlan) -> List[Tuple[int, int]]
+    '''Collapse the step-level dependencies of an execution plan into the deduplicated set of
+    (upstream, downstream) edges between coalesced solid handles.
+
+    Solid handles are identified by their (dense, integer) position in ``coalesced_plan``.
+
+    Returns:
+        List[Tuple[int, int]]: The edges, sorted so that the resulting DAG is built
+        deterministically.
+    '''
+    handle_to_id = {solid_handle: i for i, solid_handle in enumerate(coalesced_plan.keys())}
+
+    # Resolve each step's solid handle once up front, rather than once per dependency edge
+    step_to_id = {
+        step.key: handle_to_id[step.solid_handle.to_string()] for step in execution_plan.steps
+    }
+
+    edges = set()
+    for solid_id, solid_steps in enumerate(coalesced_plan.values()):
+        for solid_step in solid_steps:
+            for step_input in solid_step.step_inputs:
+                for key in step_input.dependency_keys:
+                    prev_solid_id = step_to_id[key]
+                    if solid_id != prev_solid_id:
+                        edges.add((prev_solid_id, solid_id))
+
+    return sorted(edges)
 
 
 def _make_airflow_dag(
-    handle,
-    pipeline_name,
-    environment_dict=None,
-    mode=None,
-    instance=None,
-    dag_id=None,
-    dag_description=None,
-    dag_kwargs=None,
-    op_kwargs=None,
-    operator=DagsterPythonOperator,
+    handle,  # type: ExecutionTargetHandle
+    pipeline_name,  # type: str
+    environment_dict=None,  # type: Optional[Dict[str, Any]]
+    mode=None,  # type: Optional[str]
+    instance=None,  # type: Optional[DagsterInstance]
+    dag_id=None,  # type: Optional[str]
+    dag_description=None,  # type: Optional[str]
+    dag_kwargs=None,  # type: Optional[Dict[str, Any]]
+    op_kwargs=None,  # type: Optional[Dict[str, Any]]
+    operator=DagsterPythonOperator,  # type: Type[BaseOperator]
 ):
+    # type: (...) -> Tuple[DAG, List[BaseOperator]]
+    '''Shared implementation of the DAG factories.
+
+    Unlike the other params, ``op_kwargs`` is not validated here: the public entrypoints validate it
+    (and default it to a dict) before adding any operator-specific kwargs, such as ``image``.
+    '''
     check.inst_param(handle, 'handle', ExecutionTargetHandle)
     check.str_param(pipeline_name, 'pipeline_name')
-    environment_dict = check.opt_dict_param(environment_dict, 'environment_dict', key_type=str)
+    environment_dict = _opt_dict_param(environment_dict, 'environment_dict')
     mode = check.opt_str_param(mode, 'mode')
-    # Default to use the (persistent) system temp directory rather than a seven.TemporaryDirectory,
-    # which would not be consistent between Airflow task invocations.
     instance = (
         check.inst_param(instance, 'instance', DagsterInstance)
         if instance
-        else DagsterInstance.get(fallback_storage=seven.get_system_temp_directory())
+        else _default_instance(os.getenv('DAGSTER_HOME'))
     )
 
     # Only used for Airflow; internally we continue to use pipeline.name
@@ -76,66 +228,50 @@ def _make_airflow_dag(
     )
     check.subclass_param(operator, 'operator', BaseOperator)
 
-    dag_kwargs = dict(
-        {'default_args': DEFAULT_ARGS},
-        **check.opt_dict_param(dag_kwargs, 'dag_kwargs', key_type=str)
-    )
+    # User-supplied dag_kwargs (including default_args) take precedence over our defaults
+    user_dag_kwargs = _opt_dict_param(dag_kwargs, 'dag_kwargs')
+    dag_kwargs = {'default_args': DEFAULT_ARGS}
+    dag_kwargs.update(user_dag_kwargs)
 
-    op_kwargs = check.opt_dict_param(op_kwargs, 'op_kwargs', key_type=str)
+    op_kwargs = op_kwargs or {}
 
     dag = DAG(dag_id=dag_id, description=dag_description, **dag_kwargs)
 
-    pipeline = handle.build_pipeline_definition()
-
-    if mode is None:
-        mode = pipeline.get_default_mode_name()
-
-    execution_plan = create_execution_plan(
-        pipeline, environment_dict, run_config=RunConfig(mode=mode)
+    mode, execution_plan, coalesced_plan = _get_coalesced_execution_plan(
+        handle, pipeline_name, environment_dict, mode
     )
 
-    tasks = {}
+    tasks = []
 
-    coalesced_plan = coalesce_execution_steps(execution_plan)
+    instance_ref = instance.get_ref()
+    use_python_operator = operator is DagsterPythonOperator
 
     for solid_handle, solid_steps in coalesced_plan.items():
 
         step_keys = [step.key for step in solid_steps]
 
-        if operator == DagsterPythonOperator:
-            task = operator(
-                handle=handle,
-                pipeline_name=pipeline_name,
-                environment_dict=environment_dict,
-                mode=mode,
-                task_id=solid_handle,
-                step_keys=step_keys,
-                dag=dag,
-                instance_ref=instance.get_ref(),
-                **op_kwargs
-            )
+        task_kwargs = dict(
+            pipeline_name=pipeline_name,
+            environment_dict=environment_dict,
+            mode=mode,
+            task_id=solid_handle,
+            step_keys=step_keys,
+            dag=dag,
+            instance_ref=instance_ref,
+            **op_kwargs
+        )
+        # Pass handle as a keyword so that a handle in op_kwargs still raises a TypeError
+        if use_python_operator:
+            task = operator(handle=handle, **task_kwargs)
         else:
-            task = operator(
-                pipeline_name=pipeline_name,
-                environment_dict=environment_dict,
-                mode=mode,
-                task_id=solid_handle,
-                step_keys=step_keys,
-                dag=dag,
-                instance_ref=instance.get_ref(),
-                **op_kwargs
-            )
-
-        tasks[solid_handle] = task
+            task = operator(**task_kwargs)
 
-        for solid_step in solid_steps:
-            for step_input in solid_step.step_inputs:
-                for key in step_input.dependency_keys:
-                    prev_solid_handle = execution_plan.get_step_by_key(key).solid_handle.to_string()
-                    if solid_handle != prev_solid_handle:
-                        tasks[prev_solid_handle].set_downstream(task)
+        tasks.append(task)
+
+    for prev_solid_id, solid_id in _coalesced_dependency_edges(execution_plan, coalesced_plan):
+        tasks[prev_solid_id].set_downstream(tasks[solid_id])
 
-    return (dag, [tasks[solid_handle] for solid_handle in coalesced_plan.keys()])
+    return (dag, tasks)
 
 
 def make_airflow_dag(
@@ -189,6 +325,8 @@ def make_airflow_dag(
 
     handle = ExecutionTargetHandle.for_pipeline_module(module_name, pipeline_name)
 
+    op_kwargs = _opt_dict_param(op_kwargs, 'op_kwargs')
+
     return _make_airflow_dag(
         handle=handle,
         pipeline_name=pipeline_name,
@@ -212,6 +350,8 @@ def make_airflow_dag_for_handle(
     dag_kwargs=None,
     op_kwargs=None,
 ):
+    op_kwargs = _opt_dict_param(op_kwargs, 'op_kwargs')
+
     return _make_airflow_dag(
         handle=handle,
         pipeline_name=pipeline_name,
@@ -275,7 +415,7 @@ def make_airflow_dag_containerized(
 
     handle = ExecutionTargetHandle.for_pipeline_module(module_name, pipeline_name)
 
-    op_kwargs = check.opt_dict_param(op_kwargs, 'op_kwargs', key_type=str)
+    op_kwargs = _opt_dict_param(op_kwargs, 'op_kwargs')
     op_kwargs['image'] = image
     return _make_airflow_dag(
         handle=handle,
@@ -301,7 +441,7 @@ def make_airflow_dag_containerized_for_handle(
     dag_kwargs=None,
     op_kwargs=None,
 ):
-    op_kwargs = check.opt_dict_param(op_kwargs, 'op_kwargs', key_type=str)
+    op_kwargs = _opt_dict_param(op_kwargs, 'op_kwargs')
     op_kwargs['image'] = image
 
     return _make_airflow_dag(
@@ -332,7 +472,7 @@ def make_airflow_dag_kubernetized_for_handle(
     from .operators.kubernetes_operator import DagsterKubernetesPodOperator
 
     # See: https://github.com/dagster-io/dagster/issues/1663
-    op_kwargs = check.opt_dict_param(op_kwargs, 'op_kwargs', key_type=str)
+    op_kwargs = _opt_dict_param(op_kwargs, 'op_kwargs')
     op_kwargs['image'] = image
     op_kwargs['namespace'] = namespace
 
@@ -1,9 +1,18 @@
 from __future__ import unicode_literals
 
 import uuid
+from collections import OrderedDict
 
+import pytest
 from airflow.exceptions import AirflowSkipException
-from dagster_airflow.factory import AIRFLOW_MAX_DAG_NAME_LEN, _rename_for_airflow
+from dagster_airflow.factory import (
+    AIRFLOW_MAX_DAG_NAME_LEN,
+    _coalesced_dependency_edges,
+    _get_coalesced_execution_plan,
+    _opt_dict_param,
+    _rename_for_airflow,
+    make_airflow_dag_for_handle,
+)
 from dagster_airflow.test_fixtures import (  # pylint: disable=unused-import
     dagster_airflow_docker_operator_pipeline,
     dagster_airflow_k8s_operator_pipeline,
@@ -13,6 +22,7 @@ from dagster_airflow_tests.conftest import IMAGE
 from dagster_airflow_tests.marks import nettest
 
 from dagster import ExecutionTargetHandle
+from dagster.check import CheckError
 from dagster.core.events.log import DagsterEventRecord
 from dagster.utils import script_relative_path
 
@@ -228,6 +238,115 @@ def test_rename_for_airflow():
         assert after == _rename_for_airflow(before)
 
 
+@pytest.mark.parametrize('fast_checks', [False, True])
+def test_opt_dict_param(monkeypatch, fast_checks):
+    monkeypatch.setattr('dagster_airflow.factory._FAST_CHECKS', fast_checks)
+
+    op_kwargs = {'image': 'foo'}
+    assert _opt_dict_param(op_kwargs, 'op_kwargs') is op_kwargs
+    assert _opt_dict_param(None, 'op_kwargs') == {}
+
+    with pytest.raises(CheckError):
+        _opt_dict_param(['image'], 'op_kwargs')
+
+
+DEMO_PIPELINE_MODULE = 'dagster_airflow_tests.test_project.dagster_airflow_demo'
+
+
+@pytest.fixture
+def empty_plan_cache(monkeypatch):
+    plan_cache = OrderedDict()
+    monkeypatch.setattr('dagster_airflow.factory._PLAN_CACHE', plan_cache)
+    return plan_cache
+
+
+@pytest.fixture
+def demo_pipeline_handle():
+    return ExecutionTargetHandle.for_pipeline_module(DEMO_PIPELINE_MODULE, 'demo_pipeline')
+
+
+@pytest.fixture
+def demo_environment_dict():
+    return {
+        'solids': {
+            'multiply_the_word': {'inputs': {'word': {'value': 'bar'}}, 'config': {'factor': 2}}
+        }
+    }
+
+
+# pylint: disable=redefined-outer-name
+def test_coalesced_execution_plan_cache(
+    empty_plan_cache, demo_pipeline_handle, demo_environment_dict
+):
+    mode, execution_plan, coalesced_plan = _get_coalesced_execution_plan(
+        demo_pipeline_handle, 'demo_pipeline', demo_environment_dict, None
+    )
+    assert mode == 'default'
+    assert list(coalesced_plan.keys()) == ['multiply_the_word', 'count_letters']
+
+    # An equivalent handle and environment dict, even one built in a different key order, should
+    # hit the cache
+    same_handle = ExecutionTargetHandle.for_pipeline_module(DEMO_PIPELINE_MODULE, 'demo_pipeline')
+    same_environment_dict = {
+        'solids': {
+            'multiply_the_word': OrderedDict(
+                [('config', {'factor': 2}), ('inputs', {'word': {'value': 'bar'}})]
+            )
+        }
+    }
+    assert _get_coalesced_execution_plan(
+        same_handle, 'demo_pipeline', same_environment_dict, None
+    ) == (mode, execution_plan, coalesced_plan)
+
+    demo_environment_dict['solids']['multiply_the_word']['config']['factor'] = 3
+    _, other_execution_plan, _ = _get_coalesced_execution_plan(
+        demo_pipeline_handle, 'demo_pipeline', demo_environment_dict, None
+    )
+    assert other_execution_plan is not execution_plan
+    assert len(empty_plan_cache) == 2
+
+
+def test_coalesced_execution_plan_not_cached_for_python_file(
+    empty_plan_cache, demo_environment_dict
+):
+    # Python file handles re-execute the file on every load, so edits must not be masked by a
+    # cached plan
+    handle = ExecutionTargetHandle.for_pipeline_python_file(
+        script_relative_path('test_project/dagster_airflow_demo.py'), 'demo_pipeline'
+    )
+
+    _, execution_plan, _ = _get_coalesced_execution_plan(
+        handle, 'demo_pipeline', demo_environment_dict, None
+    )
+    _, other_execution_plan, _ = _get_coalesced_execution_plan(
+        handle, 'demo_pipeline', demo_environment_dict, None
+    )
+
+    assert other_execution_plan is not execution_plan
+    assert not empty_plan_cache
+
+
+@pytest.mark.usefixtures('empty_plan_cache')
+def test_coalesced_dependency_edges(demo_pipeline_handle, demo_environment_dict):
+    _, execution_plan, coalesced_plan = _get_coalesced_execution_plan(
+        demo_pipeline_handle, 'demo_pipeline', demo_environment_dict, None
+    )
+
+    assert list(coalesced_plan.keys()) == ['multiply_the_word', 'count_letters']
+    assert _coalesced_dependency_edges(execution_plan, coalesced_plan) == [(0, 1)]
+
+
+@pytest.mark.usefixtures('empty_plan_cache')
+def test_make_airflow_dag_rejects_handle_in_op_kwargs(demo_pipeline_handle, demo_environment_dict):
+    with pytest.raises(TypeError, match='handle'):
+        make_airflow_dag_for_handle(
+            demo_pipeline_handle,
+            'demo_pipeline',
+            environment_dict=demo_environment_dict,
+            op_kwargs={'handle': demo_pipeline_handle},
+        )
+
+
 def validate_skip_pipeline_execution(result):
     expected_airflow_task_states = {
         ('foo', False),
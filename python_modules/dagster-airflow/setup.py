@@ -47,6 +47,7 @@ def _do_setup(name='dagster-airflow'):
             'dagster-graphql=={ver}'.format(ver=ver),
             'docker',
             'python-dateutil>=2.8.0',
+            'typing; python_version<"3"',
         ],
         extras_require={'kubernetes': kubernetes},
         entry_points={'console_scripts': ['dagster-airflow = dagster_airflow.cli:main']},
@@ -46,6 +46,18 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
             event (EventRecord): The event to store.
         '''
 
+    def store_events(self, events):
+        '''Store a batch of events, possibly corresponding to several pipeline runs.
+
+        Storages that can write many events more cheaply than one at a time should override this.
+
+        Args:
+            events (List[EventRecord]): The events to store, in order.
+        '''
+        check.list_param(events, 'events', of_type=EventRecord)
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id):
         '''Remove events for a given run id'''
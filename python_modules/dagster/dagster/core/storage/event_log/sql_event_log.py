@@ -1,5 +1,6 @@
 import datetime
 from abc import abstractmethod
+from collections import OrderedDict
 
 import six
 import sqlalchemy as db
@@ -31,6 +32,18 @@ class SqlEventLogStorage(EventLogStorage):
         out-of-date instance of the storage up to date.
         '''
 
+    def _event_to_row(self, event):
+        dagster_event_type = None
+        if event.is_dagster_event:
+            dagster_event_type = event.dagster_event.event_type_value
+
+        return {
+            'run_id': event.run_id,
+            'event': serialize_dagster_namedtuple(event),
+            'dagster_event_type': dagster_event_type,
+            'timestamp': datetime.datetime.fromtimestamp(event.timestamp),
+        }
+
     def store_event(self, event):
         '''Store an event corresponding to a pipeline run.
 
@@ -39,23 +52,33 @@ class SqlEventLogStorage(EventLogStorage):
         '''
         check.inst_param(event, 'event', EventRecord)
 
-        dagster_event_type = None
-        if event.is_dagster_event:
-            dagster_event_type = event.dagster_event.event_type_value
-
-        run_id = event.run_id
-
         # https://stackoverflow.com/a/54386260/324449
         event_insert = SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
-            run_id=run_id,
-            event=serialize_dagster_namedtuple(event),
-            dagster_event_type=dagster_event_type,
-            timestamp=datetime.datetime.fromtimestamp(event.timestamp),
+            **self._event_to_row(event)
         )
 
-        with self.connect(run_id) as conn:
+        with self.connect(event.run_id) as conn:
             conn.execute(event_insert)
 
+    def store_events(self, events):
+        '''Store a batch of events, possibly corresponding to several pipeline runs.
+
+        The events for each run are written with a single multi-row insert (executemany), in one
+        transaction, rather than one round trip and commit per event.
+
+        Args:
+            events (List[EventRecord]): The events to store, in order.
+        '''
+        check.list_param(events, 'events', of_type=EventRecord)
+
+        rows_by_run_id = OrderedDict()
+        for event in events:
+            rows_by_run_id.setdefault(event.run_id, []).append(self._event_to_row(event))
+
+        for run_id, rows in rows_by_run_id.items():
+            with self.connect(run_id) as conn:
+                conn.execute(SqlEventLogStorageTable.insert(), rows)
+
     def get_logs_for_run(self, run_id, cursor=-1):
         '''Get all of the logs corresponding to a run.
 
@@ -1,4 +1,5 @@
 import os
+import threading
 import time
 
 import pytest
@@ -51,7 +52,7 @@ def test_in_memory_event_log_storage_store_events_and_wipe():
     assert len(storage.get_logs_for_run('foo')) == 0
 
 
-def test_in_memory_event_log_storage_watch():
+def test_in_memory_event_log_storage_store_events_bulk():
     def evt(name):
         return DagsterEventRecord(
             None,
@@ -67,39 +68,12 @@ def test_in_memory_event_log_storage_watch():
             ),
         )
 
-    watched = []
-    watcher = lambda x: watched.append(x)  # pylint: disable=unnecessary-lambda
-
     storage = InMemoryEventLogStorage()
-    assert len(storage.get_logs_for_run('foo')) == 0
-
-    storage.store_event(evt('Message1'))
-    assert len(storage.get_logs_for_run('foo')) == 1
-    assert len(watched) == 0
-
-    storage.watch('foo', None, watcher)
-    storage.store_event(evt('Message2'))
-    assert len(storage.get_logs_for_run('foo')) == 2
-    assert len(watched) == 1
-
-    storage.end_watch('foo', lambda event: None)
-    storage.store_event(evt('Message3'))
-    assert len(storage.get_logs_for_run('foo')) == 3
-    assert len(watched) == 2
-
-    storage.end_watch('bar', lambda event: None)
-    storage.store_event(evt('Message4'))
-    assert len(storage.get_logs_for_run('foo')) == 4
-    assert len(watched) == 3
-
-    storage.end_watch('foo', watcher)
-    storage.store_event(evt('Message5'))
-    assert len(storage.get_logs_for_run('foo')) == 5
-    assert len(watched) == 3
-
-    storage.delete_events('foo')
-    assert len(storage.get_logs_for_run('foo')) == 0
-    assert len(watched) == 3
+    storage.store_events([evt('Message1'), evt('Message2')])
+    assert [event.message for event in storage.get_logs_for_run('foo')] == [
+        'Message1',
+        'Message2',
+    ]
 
 
 def test_init_filesystem_event_log_storage():
@@ -138,7 +112,51 @@ def test_filesystem_event_log_storage_store_events_and_wipe():
         assert len(storage.get_logs_for_run('foo')) == 0
 
 
-def test_filesystem_event_log_storage_watch():
+def test_filesystem_event_log_storage_store_events_bulk():
+    def evt(name, run_id):
+        return DagsterEventRecord(
+            None,
+            name,
+            'debug',
+            '',
+            run_id,
+            time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                'nonce',
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+        storage.store_event(evt('Message1', 'foo'))
+        storage.store_events(
+            [evt('Message2', 'foo'), evt('Message1', 'bar'), evt('Message3', 'foo')]
+        )
+
+        assert [event.message for event in storage.get_logs_for_run('foo')] == [
+            'Message1',
+            'Message2',
+            'Message3',
+        ]
+        assert [event.message for event in storage.get_logs_for_run('bar')] == ['Message1']
+
+        storage.store_events([])
+        assert len(storage.get_logs_for_run('foo')) == 3
+
+
+@pytest.fixture(params=['in_memory', 'sqlite'])
+def event_log_storage(request):
+    if request.param == 'in_memory':
+        yield InMemoryEventLogStorage()
+    else:
+        with seven.TemporaryDirectory() as tmpdir_path:
+            yield SqliteEventLogStorage(tmpdir_path)
+
+
+# pylint: disable=redefined-outer-name
+def test_event_log_storage_watch(event_log_storage):
     def evt(name):
         return DagsterEventRecord(
             None,
@@ -155,43 +173,61 @@ def test_filesystem_event_log_storage_watch():
         )
 
     watched = []
+    done = threading.Event()
 
-    def callback(evt):
-        watched.append(evt)
+    def watcher(event):
+        watched.append(event)
+        done.set()
 
-    noop = lambda evt: None
+    noop = lambda event: None
 
-    with seven.TemporaryDirectory() as tmpdir_path:
-        storage = SqliteEventLogStorage(tmpdir_path)
+    storage = event_log_storage
+    storage.store_event(evt('Message1'))
+    assert len(storage.get_logs_for_run('foo')) == 1
 
-        assert len(storage.get_logs_for_run('foo')) == 0
+    # Start after the event already stored (the in-memory storage never replays past events)
+    storage.watch('foo', 2, watcher)
 
-        storage.store_event(evt('Message1'))
-        assert len(storage.get_logs_for_run('foo')) == 1
-        assert len(watched) == 0
+    storage.store_event(evt('Message2'))
+    assert done.wait(timeout=5.0)
+    done.clear()
+    assert [event.message for event in watched] == ['Message2']
+
+    # Ending the watch of another callback or another run leaves this watcher in place
+    storage.end_watch('foo', noop)
+    storage.store_event(evt('Message3'))
+    assert done.wait(timeout=5.0)
+    done.clear()
+    assert [event.message for event in watched] == ['Message2', 'Message3']
 
-        storage.watch('foo', 2, callback)
-        storage.store_event(evt('Message2'))
-        assert len(storage.get_logs_for_run('foo')) == 2
+    storage.end_watch('bar', noop)
+    storage.store_event(evt('Message4'))
+    assert done.wait(timeout=5.0)
+    done.clear()
+    assert [event.message for event in watched] == ['Message2', 'Message3', 'Message4']
 
-        storage.end_watch('foo', noop)
-        storage.store_event(evt('Message3'))
-        assert len(storage.get_logs_for_run('foo')) == 3
+    storage.end_watch('foo', watcher)
+    storage.store_event(evt('Message5'))
+    assert not done.is_set()
 
-        storage.end_watch('bar', noop)
-        storage.store_event(evt('Message4'))
-        assert len(storage.get_logs_for_run('foo')) == 4
+    # Watchers are called in order (the Sqlite ones on a single observer thread), so once a watcher
+    # registered later has seen a later event, any stray delivery of Message5 would have happened
+    sentinel_done = threading.Event()
 
-        time.sleep(0.5)  # this value scientifically selected from a range of attractive values
-        storage.end_watch('foo', callback)
-        time.sleep(0.5)
-        storage.store_event(evt('Message5'))
-        assert len(storage.get_logs_for_run('foo')) == 5
-        assert len(watched) == 3
+    def sentinel(event):
+        if event.message == 'Message6':
+            sentinel_done.set()
 
-        storage.delete_events('foo')
-        assert len(storage.get_logs_for_run('foo')) == 0
-        assert len(watched) == 3
+    storage.watch('foo', None, sentinel)
+    storage.store_event(evt('Message6'))
+    assert sentinel_done.wait(timeout=5.0)
+    storage.end_watch('foo', sentinel)
+    assert len(storage.get_logs_for_run('foo')) == 6
+    assert len(watched) == 3
+
+    storage.delete_events('foo')
+    assert len(storage.get_logs_for_run('foo')) == 0
+    assert len(watched) == 3
 
 
 def test_event_log_delete():
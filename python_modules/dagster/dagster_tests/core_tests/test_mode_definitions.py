@@ -103,9 +103,19 @@ def test_mode_double_given_name():
     )
 
 
-def test_execute_multi_mode():
-    multi_mode_pipeline = define_multi_mode_pipeline()
+# Pipeline definitions are not mutated by execution, so build each one once per module
+@pytest.fixture(scope='module')
+def multi_mode_pipeline():
+    return define_multi_mode_pipeline()
 
+
+@pytest.fixture(scope='module')
+def multi_mode_with_resources_pipeline():
+    return define_multi_mode_with_resources_pipeline()
+
+
+# pylint: disable=redefined-outer-name
+def test_execute_multi_mode(multi_mode_pipeline):
     assert (
         execute_pipeline(multi_mode_pipeline, run_config=RunConfig(mode='mode_one'))
         .result_for_solid('return_three')
@@ -121,9 +131,7 @@ def test_execute_multi_mode():
     )
 
 
-def test_execute_multi_mode_errors():
-    multi_mode_pipeline = define_multi_mode_pipeline()
-
+def test_execute_multi_mode_errors(multi_mode_pipeline):
     with pytest.raises(DagsterInvariantViolationError):
         execute_pipeline(multi_mode_pipeline)
 
@@ -131,8 +139,8 @@ def test_execute_multi_mode_errors():
         execute_pipeline(multi_mode_pipeline, run_config=RunConfig(mode='wrong_mode'))
 
 
-def test_execute_multi_mode_with_resources():
-    pipeline_def = define_multi_mode_with_resources_pipeline()
+def test_execute_multi_mode_with_resources(multi_mode_with_resources_pipeline):
+    pipeline_def = multi_mode_with_resources_pipeline
 
     add_mode_result = execute_pipeline(
         pipeline_def,
@@ -103,6 +103,45 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
                 (res[0] + '_' + str(res[1]),),
             )
 
+    def store_events(self, events):
+        '''Store a batch of events, possibly corresponding to several pipeline runs.
+
+        The events are written with a single multi-row insert, and a single statement then sends a
+        notification for each inserted row so that watchers see every event, as with store_event.
+
+        Args:
+            events (List[EventRecord]): The events to store, in order.
+        '''
+        check.list_param(events, 'events', of_type=EventRecord)
+
+        if not events:
+            return
+
+        with self.connect() as conn:
+            event_insert = SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+                [self._event_to_row(event) for event in events]
+            )
+            result_proxy = conn.execute(
+                event_insert.returning(
+                    SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+                )
+            )
+            res = result_proxy.fetchall()
+            result_proxy.close()
+            # Send every notification in one statement, in insertion order, so that watchers
+            # receive the events in order
+            notify_proxy = conn.execute(
+                '''SELECT pg_notify(%s, payload) FROM unnest(%s) AS payload; ''',
+                (
+                    CHANNEL_NAME,
+                    [
+                        run_id + '_' + str(event_id)
+                        for run_id, event_id in sorted(res, key=lambda row: row[1])
+                    ],
+                ),
+            )
+            notify_proxy.close()
+
     @contextmanager
     def connect(self, run_id=None):
         with self.get_engine() as engine:
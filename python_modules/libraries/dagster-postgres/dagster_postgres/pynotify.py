@@ -126,7 +126,8 @@ def await_pg_notifications(
 
                     notify_list = []
                     while conn.notifies:
-                        notify_list.append(conn.notifies.pop())
+                        # Notifications are appended as they arrive, so take the oldest first
+                        notify_list.append(conn.notifies.pop(0))
 
                     for notif in notify_list:
                         yield notif
@@ -364,6 +364,38 @@ def test_listen_notify_single_run_event(conn_string):
         del event_log_storage
 
 
+def test_listen_notify_store_events(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    event_list = []
+
+    run_id = str(uuid.uuid4())
+
+    event_log_storage.watch(run_id, 0, event_list.append)
+
+    try:
+        events, _ = gather_events(_solids, run_config=RunConfig(run_id=run_id))
+        event_log_storage.store_events(events)
+
+        assert len(event_log_storage.get_logs_for_run(run_id)) == 7
+
+        start = time.time()
+        while len(event_list) < 7 and time.time() - start < TEST_TIMEOUT:
+            pass
+
+        assert len(event_list) == 7
+        assert [event.message for event in event_list] == [event.message for event in events]
+    finally:
+        del event_log_storage
+
+
 def test_listen_notify_filter_two_runs_event(conn_string):
     event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
 